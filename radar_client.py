@@ -21,65 +21,358 @@ Usage:
     categories = client.get_categories()
 """
 
+import asyncio
+import copy
+import functools
+import importlib.util
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Optional, Any
-from urllib.parse import urljoin, urlencode
 import json
-from datetime import datetime
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# Only advertise brotli when a decoder is installed; urllib3 passes
+# Content-Encoding: br bodies through undecoded otherwise
+_ACCEPT_ENCODING = (
+    'gzip, deflate, br'
+    if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi')
+    else 'gzip, deflate'
+)
+
+# Fields extracted from each search result when building top_matches
+_MATCH_FIELDS = itemgetter('infringement_id', 'infringement_name',
+                           'category_name', 'relevance_score')
+
+
+def _json_loads(content) -> Any:
+    """Decode a JSON payload, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Encode a JSON body, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
 
 
 class RADARClient:
-    """Client for interacting with the RADAR Framework API"""
-    
-    def __init__(self, base_url: str, contact_url: str, version: Optional[str] = None, timeout: int = 30):
+    """
+    Client for interacting with the RADAR Framework API
+
+    The client keeps a pooled keep-alive session, so reuse a single instance
+    across calls rather than instantiating one per request — each new instance
+    pays the TCP/TLS handshake again.
+    """
+
+    __slots__ = (
+        'base_url',
+        'contact_url',
+        'default_version',
+        'timeout',
+        'session',
+        '_version_info',
+        '_async_session',
+        '_cache',
+        '_executor',
+        '_urls',
+        '_transport',
+        '_transport_errors',
+    )
+
+    # Client-side cache TTLs (seconds) per endpoint. Version-pinned metadata
+    # is effectively immutable, so long TTLs are safe; /health stays fresh.
+    _CACHE_TTL = {
+        '/api/v1/versions': 60,
+        '/api/v1/framework': 3600,
+        '/api/v1/categories': 3600,
+        '/api/v1/dsa-articles': 3600,
+        '/api/v1/stats': 3600,
+        '/api/v1/health': 5,
+    }
+
+    # Fixed endpoint paths whose full URLs are precomputed at init time
+    _STATIC_ENDPOINTS = (
+        '/api/v1',
+        '/api/v1/versions',
+        '/api/v1/framework',
+        '/api/v1/categories',
+        '/api/v1/infringements',
+        '/api/v1/infringements/search',
+        '/api/v1/dsa-articles',
+        '/api/v1/stats',
+        '/api/v1/health',
+    )
+
+    def __init__(self, base_url: str, contact_url: str, version: Optional[str] = None, timeout: int = 30,
+                 cache_path: Optional[str] = None, transport: str = 'requests'):
         """
         Initialize the RADAR API client.
-        
+
         Args:
             base_url: Base URL of the RADAR API (e.g., "http://api.radar.checkfirst.network")
             contact_url: URL where you can be contacted (required for User-Agent)
             version: Default framework version to use (optional)
             timeout: Request timeout in seconds (default: 30)
+            cache_path: Path to a persistent SQLite HTTP cache (optional,
+                requires requests-cache); survives client restarts so repeat
+                analyses over pinned versions run with near-zero network cost
+            transport: 'requests' (default) or 'httpx'; the httpx transport
+                speaks HTTP/2, multiplexing burst calls like
+                search_across_versions over a single TLS connection
+                (requires httpx[http2]). The *_async methods always use
+                aiohttp regardless of this setting.
         """
         self.base_url = base_url.rstrip('/')
         self.contact_url = contact_url
         self.default_version = version
         self.timeout = timeout
-        self.session = requests.Session()
-        
+
+        if transport not in ('requests', 'httpx'):
+            raise ValueError(f"Unknown transport: {transport!r}")
+        self._transport = transport
+
+        if transport == 'httpx':
+            if httpx is None:
+                raise ImportError(
+                    "httpx is required for the httpx transport (pip install 'httpx[http2]')")
+            if cache_path:
+                raise ValueError("cache_path requires the requests transport")
+            self.session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+                timeout=timeout
+            )
+            self._transport_errors = (httpx.TransportError,)
+        elif cache_path:
+            if requests_cache is None:
+                raise ImportError(
+                    "requests-cache is required for cache_path (pip install requests-cache)")
+            # Version-pinned metadata is immutable, so cache it forever when a
+            # default version is pinned; otherwise keep a conservative TTL
+            # since responses follow the floating latest version
+            immutable = requests_cache.NEVER_EXPIRE if version else 3600
+            self.session = requests_cache.CachedSession(
+                cache_path,
+                backend='sqlite',
+                fast_save=True,
+                expire_after=300,
+                urls_expire_after={
+                    '*/api/v1/health': requests_cache.DO_NOT_CACHE,
+                    '*/api/v1/versions': 60,
+                    '*/api/v1/framework*': immutable,
+                    '*/api/v1/categories*': immutable,
+                    '*/api/v1/dsa-articles*': immutable,
+                    '*/api/v1/stats*': immutable,
+                    '*/api/v1/infringements*': immutable,
+                }
+            )
+        else:
+            self.session = requests.Session()
+
+        if transport == 'requests':
+            self._transport_errors = (requests.exceptions.ConnectionError,
+                                      requests.exceptions.Timeout,
+                                      requests.exceptions.RetryError)
+
+            # Keep-alive pool sized for the burst patterns in compare_versions /
+            # search_across_versions, with retries on transient upstream errors
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=(502, 503, 504),
+                    allowed_methods=frozenset(['GET'])
+                )
+            )
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+
+            # Connection is a hop-by-hop header and must not be sent over HTTP/2
+            self.session.headers['Connection'] = 'keep-alive'
+
         # Set required User-Agent header
         self.session.headers.update({
             'User-Agent': f'RADAR-Python-Client/2.0 ({contact_url})',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Accept-Encoding': _ACCEPT_ENCODING
         })
         
         # Cache current version info
         self._version_info = None
-        self._last_version_check = None
+
+        # Response cache: (method, endpoint, params) -> (timestamp, etag, payload)
+        self._cache = {}
+
+        # Thread pool for parallel fetches (created lazily)
+        self._executor = None
+
+        # Precomputed full URLs for the fixed endpoint set, so the hot path
+        # skips URL parsing entirely
+        self._urls = {endpoint: f'{self.base_url}{endpoint}'
+                      for endpoint in self._STATIC_ENDPOINTS}
+
+        # aiohttp session for async usage (created by __aenter__)
+        self._async_session = None
     
-    def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
+    def _cache_ttl(self, endpoint: str) -> Optional[int]:
+        """Return the cache TTL for an endpoint, or None if not cacheable"""
+        ttl = self._CACHE_TTL.get(endpoint)
+        if ttl is not None:
+            return ttl
+        for path, path_ttl in self._CACHE_TTL.items():
+            if endpoint.startswith(path + '/'):
+                return path_ttl
+        return None
+
+    def _url(self, endpoint: str) -> str:
+        """Resolve an endpoint path to a full URL"""
+        return self._urls.get(endpoint) or f'{self.base_url}{endpoint}'
+
+    def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None,
                       data: Optional[Dict] = None) -> Dict:
         """Make HTTP request to the API"""
-        url = urljoin(self.base_url, endpoint)
-        
+        url = self._url(endpoint)
+
         # Add version parameter if set and not already in params
-        if self.default_version and params is not None and 'version' not in params:
-            params['version'] = self.default_version
-        elif self.default_version and params is None:
-            params = {'version': self.default_version}
-        
+        if self.default_version and (params is None or 'version' not in params):
+            params = {**(params or {}), 'version': self.default_version}
+
+        # Serve repeat metadata lookups from the in-process cache
+        ttl = self._cache_ttl(endpoint) if method == 'GET' else None
+        cache_key = None
+        cached = None
+        if ttl is not None:
+            cache_key = (method, endpoint, frozenset(params.items()) if params else None)
+            cached = self._cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                return copy.deepcopy(cached[2])
+
+        body = None
+        headers = None
+        if data is not None:
+            # Serialize the body ourselves to skip requests' json.dumps
+            body = _json_dumps(data)
+            headers = {'Content-Type': 'application/json'}
+
+        # Revalidate a stale cached entry instead of re-downloading the body
+        if cached is not None and cached[1]:
+            headers = {**(headers or {}), 'If-None-Match': cached[1]}
+
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                timeout=self.timeout
-            )
+            if self._transport == 'httpx':
+                response = self.session.request(
+                    method,
+                    url,
+                    params=params,
+                    content=body,
+                    headers=headers,
+                    timeout=self.timeout
+                )
+            else:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    data=body,
+                    headers=headers,
+                    timeout=self.timeout
+                )
+        except self._transport_errors as e:
+            raise RADARAPIError(f"API request failed: {str(e)}")
+
+        status = response.status_code
+        if status == 304 and cached is not None:
+            # Not modified: refresh the entry's TTL and serve the cached payload
+            self._cache[cache_key] = (time.monotonic(), cached[1], cached[2])
+            return copy.deepcopy(cached[2])
+        if status < 400:
+            try:
+                payload = _json_loads(response.content)
+            except ValueError as e:
+                raise RADARAPIError(f"Invalid JSON in response: {str(e)}")
+            if cache_key is not None:
+                self._cache[cache_key] = (time.monotonic(), response.headers.get('ETag'), payload)
+                # Hand the caller a copy so mutations don't poison the cache
+                return copy.deepcopy(payload)
+            return payload
+
+        if status in (502, 503, 504):
+            # Transient upstream failures that survived the adapter's retries
+            raise RADARAPIError(f"Upstream error {status} for {endpoint}")
+        raise RADARAPIError(f"HTTP {status}: {response.text[:200]}")
+
+    def _make_request_streaming(self, endpoint: str, params: Optional[Dict] = None,
+                                top_n: Optional[int] = None):
+        """
+        Stream items from a list endpoint's 'results' array without buffering
+        the full response body (requires ijson)
+
+        Args:
+            endpoint: Endpoint path returning a top-level 'results' array
+            params: Query parameters
+            top_n: Stop after this many items and close the connection early
+        """
+        if ijson is None:
+            raise RADARAPIError("ijson is required for streaming responses (pip install ijson)")
+        if self._transport != 'requests':
+            raise RADARAPIError("Streaming responses require the requests transport")
+
+        if self.default_version and (params is None or 'version' not in params):
+            params = {**(params or {}), 'version': self.default_version}
+
+        try:
+            response = self.session.get(self._url(endpoint), params=params,
+                                        stream=True, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
         except requests.exceptions.RequestException as e:
             raise RADARAPIError(f"API request failed: {str(e)}")
+
+        try:
+            # Read via the raw stream; let urllib3 decode the content encoding
+            response.raw.decode_content = True
+            count = 0
+            for item in ijson.items(response.raw, 'results.item'):
+                yield item
+                count += 1
+                if top_n is not None and count >= top_n:
+                    break
+        finally:
+            # Early close stops the transfer once we have what we need
+            response.close()
     
     def get_versions(self) -> Dict:
         """
@@ -101,11 +394,11 @@ class RADARClient:
     
     def get_current_version(self) -> str:
         """Get the current framework version being used"""
-        if not self._version_info or not self._last_version_check:
+        if self.default_version:
+            return self.default_version
+        if self._version_info is None:
             self._version_info = self.get_versions()
-            self._last_version_check = datetime.now()
-        
-        return self.default_version or self._version_info.get('current_version')
+        return self._version_info.get('current_version')
     
     def get_api_info(self) -> Dict:
         """Get API information and available endpoints"""
@@ -201,7 +494,41 @@ class RADARClient:
             params['version'] = version
             
         return self._make_request('GET', '/api/v1/infringements', params=params)
-    
+
+    def iter_infringements(self, category: Optional[str] = None,
+                           dsa_article: Optional[str] = None,
+                           page: int = 1,
+                           per_page: int = 20,
+                           version: Optional[str] = None,
+                           top_n: Optional[int] = None):
+        """
+        Stream infringements one at a time instead of buffering a full page
+
+        Requires ijson. Only the 'results' array is parsed; envelope fields
+        such as pagination metadata are skipped. With top_n set, the
+        connection is closed as soon as enough items have been read.
+
+        Args:
+            category: Filter by category ID
+            dsa_article: Filter by DSA article number
+            page: Page number (default: 1)
+            per_page: Results per page (default: 20, max: 100)
+            version: Specific version to use (overrides default)
+            top_n: Stop after this many items (default: whole page)
+        """
+        params = {
+            'page': page,
+            'per_page': per_page
+        }
+        if category:
+            params['category'] = category
+        if dsa_article:
+            params['dsa_article'] = dsa_article
+        if version:
+            params['version'] = version
+
+        yield from self._make_request_streaming('/api/v1/infringements', params=params, top_n=top_n)
+
     def search_infringements(self, query: str, limit: int = 10, 
                            threshold: float = 15.0,
                            version: Optional[str] = None) -> Dict:
@@ -223,7 +550,35 @@ class RADARClient:
             params['version'] = version
             
         return self._make_request('GET', '/api/v1/infringements/search', params=params)
-    
+
+    def iter_search_results(self, query: str, limit: int = 10,
+                            threshold: float = 15.0,
+                            version: Optional[str] = None,
+                            top_n: Optional[int] = None):
+        """
+        Stream search results one at a time instead of buffering the full page
+
+        Requires ijson. Only the 'results' array is parsed; envelope fields
+        such as total_found and suggestion are skipped — use
+        search_infringements when those are needed.
+
+        Args:
+            query: Search query text
+            limit: Maximum number of results (default: 10, max: 100)
+            threshold: Minimum relevance score (default: 15.0)
+            version: Specific version to use (overrides default)
+            top_n: Stop after this many items (default: all)
+        """
+        params = {
+            'q': query,
+            'limit': limit,
+            'threshold': threshold
+        }
+        if version:
+            params['version'] = version
+
+        yield from self._make_request_streaming('/api/v1/infringements/search', params=params, top_n=top_n)
+
     def get_dsa_articles(self, version: Optional[str] = None) -> Dict:
         """
         Get all DSA articles referenced in the framework
@@ -262,44 +617,70 @@ class RADARClient:
             version: Specific version to use (overrides default)
         """
         results = self.search_infringements(query, version=version)
-        
-        analysis = {
+
+        # Analyze top matches
+        top_results = results.get('results', ())[:3]
+        top_matches = [
+            {'id': inf_id, 'name': name, 'category': category, 'score': score}
+            for inf_id, name, category, score in map(_MATCH_FIELDS, top_results)
+        ]
+
+        if verbose:
+            for match, result in zip(top_matches, top_results):
+                match['description'] = result.get('description')
+                match['matched_terms'] = result.get('matched_terms', [])
+                match['observables'] = result.get('matched_observables', [])
+
+        return {
             'query': query,
             'version': results.get('version'),
             'quality': results.get('search_quality', 'unknown'),
             'total_found': results.get('total_found', 0),
             'suggestion': results.get('suggestion'),
-            'top_matches': []
+            'top_matches': top_matches
         }
-        
-        # Analyze top matches
-        for result in results.get('results', [])[:3]:
-            match = {
-                'id': result['infringement_id'],
-                'name': result['infringement_name'],
-                'category': result['category_name'],
-                'score': result['relevance_score']
-            }
-            
-            if verbose:
-                match['description'] = result.get('description')
-                match['matched_terms'] = result.get('matched_terms', [])
-                match['observables'] = result.get('matched_observables', [])
-            
-            analysis['top_matches'].append(match)
-        
-        return analysis
     
-    def get_infringement_full(self, infringement_id: str, version: Optional[str] = None) -> Dict:
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the shared thread pool for parallel fetches"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=4)
+        return self._executor
+
+    def get_infringement_full(self, infringement_id: str, version: Optional[str] = None,
+                              parallel: bool = True) -> Dict:
         """
         Get full infringement details including category context
-        
+
         Args:
             infringement_id: Infringement ID
             version: Specific version to use (overrides default)
+            parallel: Speculatively fetch the category in parallel using the
+                category id implied by the infringement id prefix
+                (e.g. 'dp_01' -> 'dp'), saving a round trip (default: True)
         """
-        infringement = self.get_infringement(infringement_id, version=version)
-        
+        if parallel and '_' in infringement_id:
+            guessed_category = infringement_id.split('_', 1)[0]
+            executor = self._get_executor()
+            infringement_future = executor.submit(self.get_infringement, infringement_id, version=version)
+            category_future = executor.submit(self.get_category, guessed_category, version=version)
+            infringement = infringement_future.result()
+            try:
+                category_full = category_future.result()
+            except RADARAPIError:
+                category_full = None
+
+            if (category_full is not None and 'category' in infringement
+                    and infringement['category']['id'] == guessed_category):
+                infringement['category_full'] = {
+                    'id': category_full['id'],
+                    'name': category_full['name'],
+                    'description': category_full.get('description')
+                }
+                return infringement
+            # Prefix guess missed (rare); fall through to the sequential fetch
+        else:
+            infringement = self.get_infringement(infringement_id, version=version)
+
         # Add category details
         if 'category' in infringement:
             category_id = infringement['category']['id']
@@ -309,7 +690,7 @@ class RADARClient:
                 'name': category_full['name'],
                 'description': category_full.get('description')
             }
-        
+
         return infringement
     
     def compare_versions(self, version1: str, version2: str) -> Dict:
@@ -320,24 +701,26 @@ class RADARClient:
             version1: First version to compare
             version2: Second version to compare
         """
-        stats1 = self.get_statistics(version=version1)
-        stats2 = self.get_statistics(version=version2)
-        
+        # Both stats fetches are independent, so issue them concurrently
+        executor = self._get_executor()
+        future1 = executor.submit(self.get_statistics, version=version1)
+        future2 = executor.submit(self.get_statistics, version=version2)
+        stats1, stats2 = future1.result(), future2.result()
+
+        totals1 = stats1['totals']
+        totals2 = stats2['totals']
+
         comparison = {
             'version1': version1,
             'version2': version2,
-            'changes': {
-                'categories': stats2['totals']['categories'] - stats1['totals']['categories'],
-                'infringements': stats2['totals']['infringements'] - stats1['totals']['infringements'],
-                'observables': stats2['totals']['observables'] - stats1['totals']['observables'],
-                'dsa_articles': stats2['totals']['dsa_articles'] - stats1['totals']['dsa_articles']
-            },
+            'changes': {key: totals2[key] - totals1[key]
+                        for key in totals1.keys() & totals2.keys()},
             'stats': {
-                'version1': stats1['totals'],
-                'version2': stats2['totals']
+                'version1': totals1,
+                'version2': totals2
             }
         }
-        
+
         return comparison
     
     def search_across_versions(self, query: str, versions: Optional[List[str]] = None,
@@ -351,28 +734,38 @@ class RADARClient:
             limit: Results per version
             threshold: Minimum relevance score
         """
+        if aiohttp is not None and self._transport != 'httpx':
+            async def _run():
+                async with self:
+                    return await self.search_across_versions_async(
+                        query, versions=versions, limit=limit, threshold=threshold)
+            return asyncio.run(_run())
+
         if versions is None:
             version_info = self.get_versions()
             versions = [v['version'] for v in version_info['versions'][:3]]  # Last 3 versions
-        
-        results = {}
-        for version in versions:
+
+        def search_one(version: str) -> Dict:
             try:
-                search_results = self.search_infringements(query, limit=limit, 
-                                                         threshold=threshold, 
-                                                         version=version)
-                results[version] = {
-                    'total_found': search_results.get('total_found', 0),
-                    'suggestion': search_results.get('suggestion'),
-                    'top_results': search_results.get('results', [])[:3]
-                }
+                search_results = self.search_infringements(query, limit=limit,
+                                                           threshold=threshold,
+                                                           version=version)
+                return self._summarize_search(search_results)
             except RADARAPIError:
-                results[version] = {'error': 'Failed to search this version'}
-        
+                return {'error': 'Failed to search this version'}
+
+        if self._transport == 'httpx':
+            # httpx.Client is thread-safe and multiplexes concurrent requests
+            # over its HTTP/2 connection, so fan out on the thread pool
+            per_version = self._get_executor().map(search_one, versions)
+        else:
+            # Sequential fallback when aiohttp is not installed
+            per_version = map(search_one, versions)
+
         return {
             'query': query,
             'versions_searched': versions,
-            'results_by_version': results
+            'results_by_version': dict(zip(versions, per_version))
         }
     
     def get_infringement_evolution(self, infringement_id: str, 
@@ -384,29 +777,194 @@ class RADARClient:
             infringement_id: Infringement ID to track
             versions: List of versions to check (None = all available)
         """
+        if aiohttp is not None and self._transport != 'httpx':
+            async def _run():
+                async with self:
+                    return await self.get_infringement_evolution_async(
+                        infringement_id, versions=versions)
+            return asyncio.run(_run())
+
         if versions is None:
             version_info = self.get_versions()
             versions = [v['version'] for v in version_info['versions']]
-        
-        evolution = {
-            'infringement_id': infringement_id,
-            'versions': {}
-        }
-        
-        for version in versions:
+
+        def fetch_one(version: str) -> Dict:
             try:
                 inf = self.get_infringement(infringement_id, version=version)
-                evolution['versions'][version] = {
-                    'exists': True,
-                    'name': inf.get('name'),
-                    'description': inf.get('description'),
-                    'observable_count': len(inf.get('observables', [])),
-                    'dsa_articles': inf.get('dsaArticles', [])
+                return self._summarize_infringement(inf)
+            except RADARAPIError:
+                return {'exists': False}
+
+        if self._transport == 'httpx':
+            # httpx.Client is thread-safe and multiplexes concurrent requests
+            # over its HTTP/2 connection, so fan out on the thread pool
+            per_version = self._get_executor().map(fetch_one, versions)
+        else:
+            # Sequential fallback when aiohttp is not installed
+            per_version = map(fetch_one, versions)
+
+        return {
+            'infringement_id': infringement_id,
+            'versions': dict(zip(versions, per_version))
+        }
+
+    @staticmethod
+    def _summarize_search(search_results: Dict) -> Dict:
+        """Build the per-version summary used by search_across_versions"""
+        return {
+            'total_found': search_results.get('total_found', 0),
+            'suggestion': search_results.get('suggestion'),
+            'top_results': search_results.get('results', [])[:3]
+        }
+
+    @staticmethod
+    def _summarize_infringement(inf: Dict) -> Dict:
+        """Build the per-version summary used by get_infringement_evolution"""
+        return {
+            'exists': True,
+            'name': inf.get('name'),
+            'description': inf.get('description'),
+            'observable_count': len(inf.get('observables', [])),
+            'dsa_articles': inf.get('dsaArticles', [])
+        }
+
+    # Async API (requires aiohttp)
+
+    async def __aenter__(self) -> 'RADARClient':
+        if aiohttp is None:
+            raise RADARAPIError("aiohttp is required for async usage (pip install aiohttp)")
+        if self._async_session is None:
+            connector = aiohttp.TCPConnector(limit=32, limit_per_host=16, ttl_dns_cache=300)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    'User-Agent': f'RADAR-Python-Client/2.0 ({self.contact_url})',
+                    'Accept': 'application/json'
                 }
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    async def _make_request_async(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                                  data: Optional[Dict] = None) -> Dict:
+        """Async counterpart of _make_request using the shared aiohttp session"""
+        if self._async_session is None:
+            await self.__aenter__()
+
+        url = self._url(endpoint)
+
+        # Add version parameter if set and not already in params
+        if self.default_version and (params is None or 'version' not in params):
+            params = {**(params or {}), 'version': self.default_version}
+
+        body = None
+        headers = None
+        if data is not None:
+            body = _json_dumps(data)
+            headers = {'Content-Type': 'application/json'}
+
+        try:
+            async with self._async_session.request(
+                method=method,
+                url=url,
+                params=params,
+                data=body,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                response.raise_for_status()
+                return await response.json(loads=_json_loads)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise RADARAPIError(f"API request failed: {str(e)}")
+
+    async def get_versions_async(self) -> Dict:
+        """Async variant of get_versions"""
+        return await self._make_request_async('GET', '/api/v1/versions')
+
+    async def search_infringements_async(self, query: str, limit: int = 10,
+                                         threshold: float = 15.0,
+                                         version: Optional[str] = None) -> Dict:
+        """Async variant of search_infringements"""
+        params = {
+            'q': query,
+            'limit': limit,
+            'threshold': threshold
+        }
+        if version:
+            params['version'] = version
+
+        return await self._make_request_async('GET', '/api/v1/infringements/search', params=params)
+
+    async def get_infringement_async(self, infringement_id: str, version: Optional[str] = None) -> Dict:
+        """Async variant of get_infringement"""
+        params = {}
+        if version:
+            params['version'] = version
+        return await self._make_request_async('GET', f'/api/v1/infringements/{infringement_id}', params=params)
+
+    async def search_across_versions_async(self, query: str, versions: Optional[List[str]] = None,
+                                           limit: int = 5, threshold: float = 15.0) -> Dict:
+        """
+        Search for infringements across multiple framework versions concurrently
+
+        Args:
+            query: Search query
+            versions: List of versions to search (None = all available)
+            limit: Results per version
+            threshold: Minimum relevance score
+        """
+        if versions is None:
+            version_info = await self.get_versions_async()
+            versions = [v['version'] for v in version_info['versions'][:3]]  # Last 3 versions
+
+        async def search_one(version: str) -> Dict:
+            try:
+                search_results = await self.search_infringements_async(
+                    query, limit=limit, threshold=threshold, version=version)
+                return self._summarize_search(search_results)
             except RADARAPIError:
-                evolution['versions'][version] = {'exists': False}
-        
-        return evolution
+                return {'error': 'Failed to search this version'}
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = {version: tg.create_task(search_one(version)) for version in versions}
+
+        return {
+            'query': query,
+            'versions_searched': versions,
+            'results_by_version': {version: task.result() for version, task in tasks.items()}
+        }
+
+    async def get_infringement_evolution_async(self, infringement_id: str,
+                                               versions: Optional[List[str]] = None) -> Dict:
+        """
+        Track how an infringement has evolved across versions, fetching concurrently
+
+        Args:
+            infringement_id: Infringement ID to track
+            versions: List of versions to check (None = all available)
+        """
+        if versions is None:
+            version_info = await self.get_versions_async()
+            versions = [v['version'] for v in version_info['versions']]
+
+        async def fetch_one(version: str) -> Dict:
+            try:
+                inf = await self.get_infringement_async(infringement_id, version=version)
+                return self._summarize_infringement(inf)
+            except RADARAPIError:
+                return {'exists': False}
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = {version: tg.create_task(fetch_one(version)) for version in versions}
+
+        return {
+            'infringement_id': infringement_id,
+            'versions': {version: task.result() for version, task in tasks.items()}
+        }
 
 
 class RADARAPIError(Exception):
@@ -423,24 +981,41 @@ def create_client(base_url: str, contact_url: str, version: Optional[str] = None
         base_url: API base URL
         contact_url: Your contact URL for the User-Agent header
         version: Default framework version (optional)
+
+    Always returns a fresh instance; use this when isolation from the
+    module-level client cache is wanted.
     """
     return RADARClient(base_url, contact_url, version)
 
 
-def quick_search(base_url: str, contact_url: str, query: str, version: Optional[str] = None) -> List[Dict]:
+@functools.lru_cache(maxsize=8)
+def _get_or_create_client(base_url: str, contact_url: str,
+                          version: Optional[str] = None) -> RADARClient:
+    """Memoized client factory so repeated quick_search calls share a session"""
+    return RADARClient(base_url, contact_url, version)
+
+
+def quick_search(base_url: str, contact_url: str, query: str, version: Optional[str] = None,
+                 client: Optional[RADARClient] = None) -> List[Dict]:
     """
     Quick search without creating a client instance
-    
+
+    Repeated calls with the same (base_url, contact_url, version) reuse a
+    memoized client, so connection pools and cached metadata survive across
+    calls. Use create_client directly if you need an isolated instance.
+
     Args:
         base_url: API base URL
         contact_url: Your contact URL
         query: Search query
         version: Framework version (optional)
-        
+        client: Existing client to reuse (optional)
+
     Returns:
         List of search results
     """
-    client = RADARClient(base_url, contact_url, version)
+    if client is None:
+        client = _get_or_create_client(base_url, contact_url, version)
     results = client.search_infringements(query)
     return results.get('results', [])
 